@@ -247,6 +247,11 @@ if "KERAS_BACKEND" in os.environ:
         _BACKEND = _backend
 
 
+# Compile small, frequently called torch backend ops (currently `scatter` and
+# `scatter_update`) with `torch.compile`, based on the KERAS_TORCH_COMPILE
+# flag. Only read when the torch backend is first imported.
+_TORCH_COMPILE_OPS = os.environ.get("KERAS_TORCH_COMPILE", "0") == "1"
+
 if _BACKEND != "tensorflow":
     # If we are not running on the tensorflow backend, we should stop tensorflow
     # from using all available GPU memory. See
@@ -8,6 +8,7 @@ import optree
 import torch
 
 from keras.src import tree
+from keras.src.backend import config
 from keras.src.backend.common import KerasVariable
 from keras.src.backend.common import global_state
 from keras.src.backend.common import standardize_dtype
@@ -48,6 +49,7 @@ TORCH_DTYPES = {
     "float8_e4m3fn": torch.float8_e4m3fn,
     "float8_e5m2": torch.float8_e5m2,
 }
+_SUPPORTED_TORCH_DTYPES = frozenset(TORCH_DTYPES.values())
 
 
 @contextlib.contextmanager
@@ -86,12 +88,29 @@ def _parse_device_input(device_name):
 
 
 def to_torch_dtype(dtype):
+    # Fast path for the common case where `dtype` is already a supported
+    # `torch.dtype`, which maps to itself.
+    if isinstance(dtype, torch.dtype) and dtype in _SUPPORTED_TORCH_DTYPES:
+        return dtype
+    if dtype is None:
+        # `None` resolves to `floatx()`, which can change at runtime, so it
+        # must not be cached.
+        return _to_torch_dtype_uncached(dtype)
+    return _to_torch_dtype_cached(dtype)
+
+
+def _to_torch_dtype_uncached(dtype):
     standardized_dtype = TORCH_DTYPES.get(standardize_dtype(dtype), None)
     if standardized_dtype is None:
         raise ValueError(f"Unsupported dtype for PyTorch: {dtype}")
     return standardized_dtype
 
 
+_to_torch_dtype_cached = functools.lru_cache(maxsize=None)(
+    _to_torch_dtype_uncached
+)
+
+
 class Variable(KerasVariable):
     def _initialize(self, value):
         if isinstance(value, torch.nn.Parameter):
@@ -191,16 +210,26 @@ def convert_to_tensor(x, dtype=None, sparse=None):
         # torch._dynamo.exc.InternalTorchDynamoError:
         # GetAttrVariable(SuperVariable(), value) has no type.
         # TorchDynamo has bugs supporting nn.Parameter type check.
-        # Return it directly instead of pass it to the rest of the logic in the
-        # function.
-        return x.value
+        # Resolve it here instead of passing it to the rest of the logic in
+        # the function, and only cast when the dtype actually differs.
+        x = x.value
+        if dtype is None:
+            return x
+        dtype = to_torch_dtype(dtype)
+        if x.dtype == dtype:
+            return x
+        return x.to(dtype)
     if is_tensor(x):
         device = get_device()
         if x.device != device:
             x = x.to(device)
         if dtype is None:
             return x
-        return x.to(to_torch_dtype(dtype))
+        dtype = to_torch_dtype(dtype)
+        if x.dtype == dtype:
+            # Skip the `.to()` dispatch when no cast is needed.
+            return x
+        return x.to(dtype)
     if dtype is None:
         if isinstance(x, bool):
             return torch.as_tensor(x, dtype=torch.bool, device=get_device())
@@ -226,6 +255,15 @@ def convert_to_tensor(x, dtype=None, sparse=None):
             x = x.astype(np.float32)
             dtype = "bfloat16"
         dtype = dtype or x.dtype
+    if (
+        dtype is None
+        and isinstance(x, (list, tuple))
+        and len(x) > 0
+        and all(type(item) in (bool, int, float) for item in x)
+    ):
+        tensor = _convert_python_scalars(x)
+        if tensor is not None:
+            return tensor
     if dtype is None:
         dtype = result_type(
             *[getattr(item, "dtype", type(item)) for item in tree.flatten(x)]
@@ -234,6 +272,29 @@ def convert_to_tensor(x, dtype=None, sparse=None):
     return torch.as_tensor(x, dtype=dtype, device=get_device())
 
 
+def _convert_python_scalars(x):
+    # NumPy parses a flat sequence of Python numbers in C, whereas
+    # `torch.as_tensor` walks it element by element through the Python object
+    # protocol. Returns `None` when the sequence has to go through
+    # `torch.as_tensor` instead.
+    array = np.array(x)
+    # Same inference as `result_type` on the Python element types.
+    if array.dtype.kind == "b":
+        return torch.from_numpy(array).to(get_device())
+    if array.dtype.kind == "f":
+        result = array.astype(floatx(), copy=False)
+    elif array.dtype.kind == "i":
+        # NumPy wraps out-of-range integers silently, torch raises.
+        info = np.iinfo("int32")
+        if array.min() < info.min or array.max() > info.max:
+            return None
+        result = array.astype("int32")
+    else:
+        # Integers that do not fit in int64.
+        return None
+    return torch.from_numpy(result).to(get_device())
+
+
 def convert_to_numpy(x):
     def transform(x):
         if is_tensor(x):
@@ -373,7 +434,7 @@ def cond(pred, true_fn, false_fn):
 
 
 def vectorized_map(function, elements):
-    return torch.vmap(function)(elements)
+    return torch.func.vmap(function)(elements)
 
 
 def map(f, xs):
@@ -551,37 +612,47 @@ def associative_scan(f, elems, reverse=False, axis=0):
     return optree.tree_unflatten(tree, scans)
 
 
+def _as_torch_fast(x):
+    # Skip all of `convert_to_tensor`'s dtype handling for inputs that are
+    # already tensors on the right device, which is the common case inside
+    # training steps.
+    if is_tensor(x) and x.device == get_device():
+        return x
+    return convert_to_tensor(x)
+
+
 def scatter(indices, values, shape):
-    indices = convert_to_tensor(indices)
-    values = convert_to_tensor(values)
+    indices = convert_to_tensor(indices, dtype=torch.int64)
+    values = _as_torch_fast(values)
     zeros = torch.zeros(shape, dtype=values.dtype, device=get_device())
 
     index_length = indices.shape[-1]
-    value_shape = shape[index_length:]
-    indices = torch.reshape(indices, [-1, index_length])
-    values = torch.reshape(values, [-1] + list(value_shape))
-
-    for i in range(indices.shape[0]):
-        index = indices[i]
-        zeros[tuple(index)] += values[i]
+    flat_shape = (-1,) + tuple(shape[index_length:])
+    indices = torch.reshape(indices, (-1, index_length))
+    values = torch.reshape(values, flat_shape)
+
+    # Accumulate all updates in a single kernel. `accumulate=True` sums the
+    # values of duplicate indices, matching the semantics of `+=`. Indexing
+    # per dimension keeps support for negative indices and bounds checks.
+    zeros.index_put_(tuple(indices.unbind(dim=1)), values, accumulate=True)
     return zeros
 
 
 def scatter_update(inputs, indices, updates):
-    inputs = convert_to_tensor(inputs)
-    indices = convert_to_tensor(indices, dtype="int64")
-    updates = convert_to_tensor(updates)
-    indices = torch.transpose(indices, 0, 1)
+    inputs = _as_torch_fast(inputs)
+    indices = convert_to_tensor(indices, dtype=torch.int64)
+    updates = convert_to_tensor(updates, dtype=inputs.dtype)
 
-    inputs[tuple(indices)] = updates
+    # `indices` has shape `(num_updates, index_length)`. `unbind` yields one
+    # index view per dimension without materializing a transposed copy.
+    inputs.index_put_(tuple(indices.unbind(dim=1)), updates)
     return inputs
 
 
 def slice(inputs, start_indices, shape):
-    shape_dtype = to_torch_dtype("int64")
     inputs = convert_to_tensor(inputs)
-    start_indices = convert_to_tensor(start_indices).to(shape_dtype)
-    shape = convert_to_tensor(shape).to(shape_dtype)
+    start_indices = convert_to_tensor(start_indices).to(torch.int64)
+    shape = convert_to_tensor(shape).to(torch.int64)
 
     python_slice = __builtins__["slice"]
     slices = [
@@ -592,21 +663,39 @@ def slice(inputs, start_indices, shape):
 
 
 def slice_update(inputs, start_indices, updates):
-    shape_dtype = to_torch_dtype("int64")
-    inputs = convert_to_tensor(inputs)
-    start_indices = convert_to_tensor(start_indices).to(shape_dtype)
-    updates = convert_to_tensor(updates)
+    inputs = _as_torch_fast(inputs)
+    updates = _as_torch_fast(updates)
+    if is_tensor(start_indices):
+        # Transfer all start indices to the host at once rather than
+        # synchronizing once per dimension.
+        start_indices = start_indices.tolist()
 
-    python_slice = __builtins__["slice"]
-    slices = [
-        python_slice(start_index, start_index + update_length)
-        for start_index, update_length in zip(start_indices, updates.shape)
-    ]
     outputs = torch.clone(inputs)
-    outputs[slices] = updates
+    # `narrow` only creates views, so the update is a single `copy_`.
+    view = outputs
+    for dim, (start_index, update_length) in enumerate(
+        zip(start_indices, updates.shape)
+    ):
+        view = view.narrow(dim, int(start_index), update_length)
+    view.copy_(updates)
     return outputs
 
 
+def _maybe_compile(fn):
+    # Opt-in compilation with TorchInductor, see `KERAS_TORCH_COMPILE`. The
+    # scatter helpers are small and called inside training steps, where
+    # per-op dispatch dominates. Shapes vary between calls, so compile them
+    # with dynamic shapes. `slice_update` is left out, since it moves start
+    # indices to the host, which breaks the graph anyway.
+    if config._TORCH_COMPILE_OPS:
+        return torch.compile(fn, dynamic=True)
+    return fn
+
+
+scatter = _maybe_compile(scatter)
+scatter_update = _maybe_compile(scatter_update)
+
+
 def switch(index, branches, *operands):
     index = convert_to_tensor(index, "int32")
     index = torch.clamp(index, 0, len(branches) - 1)
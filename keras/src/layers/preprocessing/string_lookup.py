@@ -1,3 +1,6 @@
+import concurrent.futures
+import threading
+
 import numpy as np
 
 from keras.src import backend
@@ -55,7 +58,11 @@ class StringLookup(IndexLookup):
             only be specified when adapting the vocabulary or when setting
             `pad_to_max_tokens=True`. If None, there is no cap on the size of
             the vocabulary. Note that this size includes the OOV
-            and mask tokens. Defaults to `None`.
+            and mask tokens. When set (to at most `2**31 - 1`) with
+            `output_mode="int"` and `invert=False`, the layer returns
+            `int32` indices instead of `int64` ones. `IntegerLookup` and
+            `TextVectorization` always return `int64` indices.
+            Defaults to `None`.
         num_oov_indices: The number of out-of-vocabulary tokens to use.
             If this value is more than 1, OOV inputs are modulated to
             determine their OOV value.
@@ -317,6 +324,16 @@ class StringLookup(IndexLookup):
                 "`sparse=True` can only be used with the " "TensorFlow backend."
             )
         self.encoding = encoding
+        # Lets wrapping layers such as `TextVectorization` keep a fixed index
+        # dtype.
+        index_dtype = kwargs.pop("index_dtype", None)
+        # Caches derived from the lookup table. They are built lazily and
+        # reset whenever the vocabulary changes.
+        self._reset_vocabulary_caches()
+        # Pending `adapt_async()` computation, if any, and the identifier of
+        # the thread running it.
+        self._adapt_future = None
+        self._adapt_thread_id = None
         super().__init__(
             max_tokens=max_tokens,
             num_oov_indices=num_oov_indices,
@@ -335,6 +352,19 @@ class StringLookup(IndexLookup):
         self._convert_input_args = False
         self._allow_non_tensor_positional_args = True
         self.supports_jit = False
+        # A capped vocabulary lets us return narrower indices, which halves
+        # the memory traffic of downstream ops such as embedding lookups.
+        if index_dtype is not None:
+            self._index_dtype = index_dtype
+        elif (
+            self.output_mode == "int"
+            and not self.invert
+            and self.max_tokens is not None
+            and self.max_tokens <= np.iinfo("int32").max
+        ):
+            self._index_dtype = "int32"
+        else:
+            self._index_dtype = "int64"
 
     def adapt(self, data, steps=None):
         """Computes a vocabulary of integer terms from tokens in a dataset.
@@ -365,8 +395,108 @@ class StringLookup(IndexLookup):
                 repeating dataset, you must specify the `steps` argument. This
                 argument is not supported with array inputs or list inputs.
         """
+        self._wait_for_adapt()
         super().adapt(data, steps=steps)
 
+    def adapt_async(self, data, steps=None):
+        """Computes the vocabulary like `adapt()`, in a background thread.
+
+        This lets vocabulary construction overlap with other work, such as
+        building the rest of the model or loading data. The first subsequent
+        call to the layer, `adapt()`, `set_vocabulary()`, `get_vocabulary()`
+        or `vocabulary_size()` blocks until the computation has finished, and
+        re-raises any error it encountered.
+
+        Arguments:
+            data: The data to train on. Same as for `adapt()`.
+            steps: Integer or `None`. Same as for `adapt()`.
+
+        Returns:
+            A `concurrent.futures.Future` that resolves once the vocabulary
+            has been computed.
+        """
+        self._wait_for_adapt()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._adapt_future = executor.submit(
+            self._adapt_in_background, data, steps=steps
+        )
+        executor.shutdown(wait=False)
+        return self._adapt_future
+
+    def _adapt_in_background(self, data, steps=None):
+        self._adapt_thread_id = threading.get_ident()
+        try:
+            # Call the base class directly, since our `adapt()` would wait on
+            # the future running this.
+            super().adapt(data, steps=steps)
+        finally:
+            self._adapt_thread_id = None
+
+    def get_vocabulary(self, include_special_tokens=True):
+        """Returns the current vocabulary of the layer.
+
+        Args:
+            include_special_tokens: If `True`, the returned vocabulary
+                will include mask and OOV tokens,
+                and a term's index in the vocabulary
+                will equal the term's index when calling the layer.
+                If `False`, the returned vocabulary will not include
+                any mask or OOV tokens.
+        """
+        self._wait_for_adapt()
+        # Exporting the vocabulary from the lookup table is O(vocab size), so
+        # we keep a copy until the vocabulary changes.
+        if self._vocabulary_cache is None:
+            self._vocabulary_cache = np.array(
+                super().get_vocabulary(include_special_tokens=True),
+                dtype=object,
+            )
+        vocabulary = self._vocabulary_cache
+        if not include_special_tokens:
+            vocabulary = vocabulary[self._token_start_index() :]
+        return vocabulary.tolist()
+
+    def vocabulary_size(self):
+        """Gets the current size of the layer's vocabulary.
+
+        Returns:
+          The integer size of the vocabulary, including optional mask and oov
+          indices.
+        """
+        self._wait_for_adapt()
+        if not tf.executing_eagerly():
+            return super().vocabulary_size()
+        if self._vocabulary_size_cache is None:
+            self._vocabulary_size_cache = super().vocabulary_size()
+        return self._vocabulary_size_cache
+
+    def set_vocabulary(self, vocabulary, idf_weights=None):
+        self._wait_for_adapt()
+        # Reset before as well as after, since the base class checks the new
+        # vocabulary size against the frozen one while setting it.
+        self._reset_vocabulary_caches()
+        super().set_vocabulary(vocabulary, idf_weights=idf_weights)
+        self._reset_vocabulary_caches()
+
+    def finalize_state(self):
+        self._reset_vocabulary_caches()
+        super().finalize_state()
+        self._reset_vocabulary_caches()
+
+    def _wait_for_adapt(self):
+        # The worker's own `adapt()` goes through the same entry points, and
+        # must not wait on itself.
+        if threading.get_ident() == self._adapt_thread_id:
+            return
+        if self._adapt_future is not None:
+            future = self._adapt_future
+            self._adapt_future = None
+            future.result()
+
+    def _reset_vocabulary_caches(self):
+        self._vocabulary_cache = None
+        self._vocabulary_size_cache = None
+
     # Overridden methods from IndexLookup.
     def _tensor_vocab_to_numpy(self, vocabulary):
         vocabulary = vocabulary.numpy()
@@ -381,14 +511,31 @@ class StringLookup(IndexLookup):
         del base_config["vocabulary_dtype"]
         return {**base_config, **config}
 
+    def compute_output_spec(self, inputs):
+        output_spec = super().compute_output_spec(inputs)
+        if self._index_dtype != "int64":
+            output_spec = backend.KerasTensor(
+                output_spec.shape, dtype=self._index_dtype
+            )
+        return output_spec
+
     def call(self, inputs):
+        self._wait_for_adapt()
         if isinstance(inputs, (tf.Tensor, tf.RaggedTensor, tf.SparseTensor)):
             tf_inputs = True
         else:
             tf_inputs = False
-            if not isinstance(inputs, (np.ndarray, list, tuple)):
-                inputs = tf.convert_to_tensor(backend.convert_to_numpy(inputs))
+            if backend.backend() == "torch" and backend.is_tensor(inputs):
+                # Unlike `convert_to_numpy()`, `.numpy()` shares memory with
+                # the CPU tensor, so only a device transfer may copy.
+                inputs = tf.convert_to_tensor(inputs.detach().cpu().numpy())
+            elif not isinstance(inputs, (np.ndarray, list, tuple)):
+                # `np.asarray` avoids a copy for array-likes that expose
+                # their buffer, such as JAX arrays on CPU.
+                inputs = tf.convert_to_tensor(np.asarray(inputs))
         outputs = super().call(inputs)
+        if self._index_dtype != "int64":
+            outputs = tf.cast(outputs, self._index_dtype)
         if not tf_inputs:
             outputs = backend_utils.convert_tf_tensor(outputs)
         return outputs
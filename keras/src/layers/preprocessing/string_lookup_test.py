@@ -1,3 +1,5 @@
+import threading
+
 import numpy as np
 import pytest
 from tensorflow import data as tf_data
@@ -30,6 +32,35 @@ class StringLookupTest(testing.TestCase):
         self.assertTrue(backend.is_tensor(output))
         self.assertAllClose(output, np.array([2, 3, 0]))
 
+    def test_adapt_async_flow(self):
+        layer = layers.StringLookup(
+            output_mode="int",
+        )
+        future = layer.adapt_async(["a", "a", "a", "b", "b", "c"])
+        input_data = ["b", "c", "d"]
+        output = layer(input_data)
+        self.assertTrue(future.done())
+        self.assertAllClose(output, np.array([2, 3, 0]))
+
+    def test_adapt_async_vocabulary_size(self):
+        import tensorflow as tf
+
+        data_ready = threading.Event()
+
+        def gen():
+            data_ready.wait()
+            yield np.array(["a", "a", "b", "c"])
+
+        data = tf_data.Dataset.from_generator(
+            gen, output_signature=tf.TensorSpec((None,), tf.string)
+        )
+        layer = layers.StringLookup(output_mode="int")
+        future = layer.adapt_async(data)
+        self.assertFalse(future.done())
+        data_ready.set()
+        self.assertEqual(layer.vocabulary_size(), 4)
+        self.assertTrue(future.done())
+
     def test_fixed_vocabulary(self):
         layer = layers.StringLookup(
             output_mode="int",
@@ -70,6 +101,31 @@ class StringLookupTest(testing.TestCase):
         self.assertTrue(backend.is_tensor(output))
         self.assertAllClose(output, np.array([2, 3, 0]))
 
+    def test_vocabulary_updates(self):
+        layer = layers.StringLookup(output_mode="int")
+        self.assertEqual(layer.get_vocabulary(), ["[UNK]"])
+        self.assertEqual(layer.vocabulary_size(), 1)
+        layer.adapt(["a", "a", "b"])
+        self.assertEqual(layer.get_vocabulary(), ["[UNK]", "a", "b"])
+        self.assertEqual(layer.vocabulary_size(), 3)
+        layer.set_vocabulary(["c", "d", "e"])
+        self.assertEqual(
+            layer.get_vocabulary(include_special_tokens=False),
+            ["c", "d", "e"],
+        )
+        self.assertEqual(layer.vocabulary_size(), 4)
+
+    def test_index_dtype(self):
+        layer = layers.StringLookup(max_tokens=10, vocabulary=["a", "b", "c"])
+        output = layer(["b", "c", "d"])
+        self.assertEqual(backend.standardize_dtype(output.dtype), "int32")
+        self.assertAllClose(output, np.array([2, 3, 0]))
+
+    def test_call_without_vocabulary(self):
+        layer = layers.StringLookup()
+        with self.assertRaises(Exception):
+            layer(["a", "b"])
+
     def test_tf_data_compatibility(self):
         layer = layers.StringLookup(
             output_mode="int",
@@ -350,6 +350,7 @@ class TextVectorization(Layer):
             has_input_vocabulary=self._has_input_vocabulary,
             encoding=encoding,
             vocabulary_size=vocabulary_size,
+            index_dtype="int64",
         )
         self._convert_input_args = False
         self._allow_non_tensor_positional_args = True
@@ -52,6 +52,23 @@ class TextVectorizationTest(testing.TestCase):
         self.assertTrue(backend.is_tensor(output))
         self.assertAllClose(output, np.array([[4, 1, 3, 0], [1, 2, 0, 0]]))
 
+    def test_int_output_dtype(self):
+        layer = layers.TextVectorization(
+            max_tokens=10,
+            output_mode="int",
+            vocabulary=["baz", "bar", "foo"],
+        )
+        output_spec = layer.compute_output_spec(
+            backend.KerasTensor((None,), dtype="string")
+        )
+        self.assertEqual(output_spec.dtype, "int64")
+        output = layer(["foo qux bar"])
+        expected = backend.convert_to_tensor(np.zeros((), dtype="int64"))
+        self.assertEqual(
+            backend.standardize_dtype(output.dtype),
+            backend.standardize_dtype(expected.dtype),
+        )
+
     def test_set_vocabulary(self):
         max_tokens = 5000
         max_len = 4
@@ -1,6 +1,7 @@
 import contextlib
 import operator
 from unittest.mock import Mock
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -320,6 +321,56 @@ class CoreOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
         indices = np.array([[0], [0]])
         values = np.array([1, 1])
         self.assertAllClose(core.scatter(indices, values, (1,)), [2])
+        # Duplicate indices with slices
+        indices = np.array([[1], [0], [1]])
+        values = np.array([[1, 2], [3, 4], [5, 6]])
+        self.assertAllClose(
+            core.scatter(indices, values, (3, 2)), [[3, 4], [6, 8], [0, 0]]
+        )
+
+    @pytest.mark.skipif(
+        backend.backend() == "tensorflow",
+        reason="`tf.scatter_nd` does not support negative indices.",
+    )
+    def test_scatter_negative_indices(self):
+        indices = np.array([[1, -1], [-2, 0]])
+        values = np.array([5, 10])
+        self.assertAllClose(
+            core.scatter(indices, values, (2, 3)), [[10, 0, 0], [0, 0, 5]]
+        )
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="`KERAS_TORCH_COMPILE` only applies to the torch backend.",
+    )
+    def test_scatter_torch_compile(self):
+        from keras.src.backend import config
+        from keras.src.backend.torch import core as torch_core
+
+        with patch.object(config, "_TORCH_COMPILE_OPS", False):
+            fn = torch_core._maybe_compile(torch_core.scatter)
+            self.assertIs(fn, torch_core.scatter)
+
+        # Same as setting `KERAS_TORCH_COMPILE=1` before importing keras.
+        with patch.object(config, "_TORCH_COMPILE_OPS", True):
+            compiled_scatter = torch_core._maybe_compile(torch_core.scatter)
+            compiled_scatter_update = torch_core._maybe_compile(
+                torch_core.scatter_update
+            )
+        self.assertIsNot(compiled_scatter, torch_core.scatter)
+        indices = np.array([[1], [0], [1]])
+        values = np.array([[1, 2], [3, 4], [5, 6]])
+        self.assertAllClose(
+            compiled_scatter(indices, values, (3, 2)),
+            [[3, 4], [6, 8], [0, 0]],
+        )
+        self.assertAllClose(
+            compiled_scatter([[1, -1]], [5], (2, 3)), [[0, 0, 0], [0, 0, 5]]
+        )
+        self.assertAllClose(
+            compiled_scatter_update(np.zeros((2, 2)), [[0, 1]], [7.0]),
+            [[0, 7], [0, 0]],
+        )
 
     def test_scatter_update(self):
         # Test 1D.
@@ -608,6 +659,74 @@ class CoreOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
         with self.assertRaises(ValueError):
             ops.convert_to_numpy(KerasTensor((2,)))
 
+    def test_convert_to_tensor_variable(self):
+        v = backend.Variable([1.0, 2.0], dtype="float32")
+        x = ops.convert_to_tensor(v)
+        self.assertEqual(backend.standardize_dtype(x.dtype), "float32")
+        self.assertAllClose(x, [1.0, 2.0])
+
+        x = ops.convert_to_tensor(v, dtype="float16")
+        self.assertEqual(backend.standardize_dtype(x.dtype), "float16")
+        self.assertAllClose(x, [1.0, 2.0])
+
+        x = ops.convert_to_tensor(v, dtype="int32")
+        self.assertEqual(backend.standardize_dtype(x.dtype), "int32")
+        self.assertAllEqual(x, [1, 2])
+
+    def test_convert_to_tensor_numeric_sequence(self):
+        x = ops.convert_to_tensor([1, 2, 3])
+        self.assertEqual(backend.standardize_dtype(x.dtype), "int32")
+        self.assertAllEqual(x, [1, 2, 3])
+
+        x = ops.convert_to_tensor((1, 2.5, True))
+        self.assertEqual(backend.standardize_dtype(x.dtype), backend.floatx())
+        self.assertAllClose(x, [1.0, 2.5, 1.0])
+
+        x = ops.convert_to_tensor([True, False])
+        self.assertEqual(backend.standardize_dtype(x.dtype), "bool")
+        self.assertAllEqual(x, [True, False])
+
+        x = ops.convert_to_tensor([], dtype="int32")
+        self.assertEqual(backend.standardize_dtype(x.dtype), "int32")
+        self.assertAllEqual(x, [])
+
+        x = ops.convert_to_tensor([1.5, -2.0], dtype="float16")
+        self.assertEqual(backend.standardize_dtype(x.dtype), "float16")
+        self.assertAllClose(x, [1.5, -2.0])
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Other backends infer dtypes of NumPy scalars differently.",
+    )
+    def test_convert_to_tensor_numpy_scalar_sequence(self):
+        for x, expected_dtype in (
+            ([np.float64(1.5)], "float64"),
+            ([1, np.float64(2.0)], "float64"),
+            ([1, np.int64(2)], "int64"),
+            ([True, np.float32(2.0)], "float32"),
+        ):
+            self.assertEqual(
+                backend.standardize_dtype(ops.convert_to_tensor(x).dtype),
+                expected_dtype,
+            )
+            self.assertEqual(
+                dtypes.result_type(*[getattr(i, "dtype", type(i)) for i in x]),
+                expected_dtype,
+            )
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Other backends handle overflow differently.",
+    )
+    def test_convert_to_tensor_numeric_sequence_overflow(self):
+        with self.assertRaisesRegex(RuntimeError, "overflow"):
+            ops.convert_to_tensor([300, -1], dtype="uint8")
+        with self.assertRaisesRegex(RuntimeError, "overflow"):
+            ops.convert_to_tensor([2**40], dtype="int32")
+        # Python ints are inferred as int32.
+        with self.assertRaisesRegex(RuntimeError, "overflow"):
+            ops.convert_to_tensor([1, 2**40])
+
     @pytest.mark.skipif(
         not backend.SUPPORTS_SPARSE_TENSORS,
         reason="Backend does not support sparse tensors.",
@@ -667,6 +786,27 @@ class CoreOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
                 lambda: ops.zeros((4,)),
             )
 
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Only relevant for `torch.compile`.",
+    )
+    def test_cond_with_side_effects_compiled(self):
+        import torch
+
+        v = backend.Variable(0.0)
+
+        # Mirrors the optimizer callers: one branch assigns, the other is a
+        # no-op returning `None`.
+        def fn(pred):
+            ops.cond(pred, lambda: v.assign_add(1.0), lambda: None)
+            return v.value
+
+        compiled_fn = torch.compile(fn)
+        compiled_fn(ops.convert_to_tensor(True))
+        self.assertAllClose(v, 1.0)
+        compiled_fn(ops.convert_to_tensor(False))
+        self.assertAllClose(v, 1.0)
+
     def test_unstack(self):
         rng = np.random.default_rng(0)
         x = rng.uniform(size=(2, 3, 4))
@@ -830,6 +970,11 @@ class CoreOpsDtypeTest(testing.TestCase, parameterized.TestCase):
             for dtype in ALL_DTYPES
             if dtype is not None
         ],
+        *[
+            ([1, 0, 1], dtype, dtype)
+            for dtype in ALL_DTYPES
+            if dtype is not None
+        ],
         *[
             ([[1, 0, 1], [1, 1, 0]], dtype, dtype)
             for dtype in ALL_DTYPES